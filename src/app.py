@@ -5,7 +5,7 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
@@ -25,78 +25,87 @@ activities = {
         "description": "Team sport focusing on basketball skills and competitive play",
         "schedule": "Mondays and Wednesdays, 4:00 PM - 5:30 PM",
         "max_participants": 15,
-        "participants": ["alex@mergington.edu"]
+        "participants": {"alex@mergington.edu"}
     },
     "Tennis Club": {
         "description": "Individual and doubles tennis lessons and matches",
         "schedule": "Saturdays, 10:00 AM - 11:30 AM",
         "max_participants": 16,
-        "participants": ["james@mergington.edu"]
+        "participants": {"james@mergington.edu"}
     },
     "Drama Club": {
         "description": "Theater performances and acting workshops",
         "schedule": "Thursdays, 4:00 PM - 6:00 PM",
         "max_participants": 25,
-        "participants": ["isabella@mergington.edu", "lucas@mergington.edu"]
+        "participants": {"isabella@mergington.edu", "lucas@mergington.edu"}
     },
     "Art Studio": {
         "description": "Painting, drawing, and sculpture classes",
         "schedule": "Tuesdays and Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 18,
-        "participants": ["mia@mergington.edu"]
+        "participants": {"mia@mergington.edu"}
     },
     "Debate Team": {
         "description": "Competitive debate and public speaking skills",
         "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
         "max_participants": 14,
-        "participants": ["noah@mergington.edu", "ava@mergington.edu"]
+        "participants": {"noah@mergington.edu", "ava@mergington.edu"}
     },
     "Math Olympiad": {
         "description": "Advanced problem-solving and mathematics competitions",
         "schedule": "Mondays and Thursdays, 4:30 PM - 5:30 PM",
         "max_participants": 20,
-        "participants": ["ethan@mergington.edu"]
+        "participants": {"ethan@mergington.edu"}
     },
     "Chess Club": {
         "description": "Learn strategies and compete in chess tournaments",
         "schedule": "Fridays, 3:30 PM - 5:00 PM",
         "max_participants": 12,
-        "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
     },
     "Programming Class": {
         "description": "Learn programming fundamentals and build software projects",
         "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
         "max_participants": 20,
-        "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
     },
     "Gym Class": {
         "description": "Physical education and sports activities",
         "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
         "max_participants": 30,
-        "participants": ["john@mergington.edu", "olivia@mergington.edu"]
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
     }
 }
 
 
+def get_activities_db():
+    """Provide the activity database to the endpoints"""
+    return activities
+
+
 @app.get("/")
 def root():
     return RedirectResponse(url="/static/index.html")
 
 
 @app.get("/activities")
-def get_activities():
-    return activities
+def get_activities(db: dict = Depends(get_activities_db)):
+    return {
+        name: {**details, "participants": sorted(details["participants"])}
+        for name, details in db.items()
+    }
 
 
 @app.post("/activities/{activity_name}/signup")
-def signup_for_activity(activity_name: str, email: str):
+def signup_for_activity(activity_name: str, email: str,
+                        db: dict = Depends(get_activities_db)):
     """Sign up a student for an activity"""
     # Validate activity exists
-    if activity_name not in activities:
+    if activity_name not in db:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Get the specific activity
-    activity = activities[activity_name]
+    activity = db[activity_name]
 
     # Validate student is not already signed up 
     if email in activity["participants"]:
@@ -107,19 +116,20 @@ def signup_for_activity(activity_name: str, email: str):
         raise HTTPException(status_code=400, detail="Activity is full")
 
     # Add student
-    activity["participants"].append(email)
+    activity["participants"].add(email)
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
 @app.delete("/activities/{activity_name}/unregister")
-def unregister_from_activity(activity_name: str, email: str):
+def unregister_from_activity(activity_name: str, email: str,
+                             db: dict = Depends(get_activities_db)):
     """Unregister a student from an activity"""
     # Validate activity exists
-    if activity_name not in activities:
+    if activity_name not in db:
         raise HTTPException(status_code=404, detail="Activity not found")
 
     # Get the specific activity
-    activity = activities[activity_name]
+    activity = db[activity_name]
 
     # Remove student if present
     if email in activity["participants"]:
@@ -0,0 +1,55 @@
+"""
+Shared fixtures for the High School Management System API tests
+"""
+import copy
+import importlib.util
+import pytest
+from fastapi.testclient import TestClient
+
+from app import app, get_activities_db
+
+# Pristine activities data, copied for each test
+_PRISTINE = {
+    "Chess Club": {
+        "description": "Learn strategies and compete in chess tournaments",
+        "schedule": "Fridays, 3:30 PM - 5:00 PM",
+        "max_participants": 12,
+        "participants": {"michael@mergington.edu", "daniel@mergington.edu"}
+    },
+    "Programming Class": {
+        "description": "Learn programming fundamentals and build software projects",
+        "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
+        "max_participants": 20,
+        "participants": {"emma@mergington.edu", "sophia@mergington.edu"}
+    },
+    "Gym Class": {
+        "description": "Physical education and sports activities",
+        "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
+        "max_participants": 30,
+        "participants": {"john@mergington.edu", "olivia@mergington.edu"}
+    }
+}
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create a test client for the FastAPI app, shared across the session"""
+    backend_options = {"use_uvloop": importlib.util.find_spec("uvloop") is not None}
+    with TestClient(app, backend="asyncio", backend_options=backend_options,
+                    follow_redirects=False) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def activities():
+    """Serve a fresh copy of the activities data to the app for each test"""
+    data = copy.deepcopy(_PRISTINE)
+    app.dependency_overrides[get_activities_db] = lambda: data
+    yield data
+    app.dependency_overrides.pop(get_activities_db, None)
+
+
+@pytest.fixture
+def activities_snapshot(client):
+    """Fetch the activities once per test and return the parsed JSON"""
+    return client.get("/activities").json()
@@ -2,46 +2,14 @@
 Tests for the High School Management System API
 """
 import pytest
-from fastapi.testclient import TestClient
-import sys
-from pathlib import Path
 
-# Add src directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+import app as app_module
 
-from app import app, activities
-
-
-@pytest.fixture
-def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
-
-
-@pytest.fixture(autouse=True)
-def reset_activities():
-    """Reset activities data before each test"""
-    activities.clear()
-    activities.update({
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        }
-    })
+CHESS_SIGNUP = "/activities/Chess Club/signup"
+CHESS_UNREGISTER = "/activities/Chess Club/unregister"
+PROG_SIGNUP = "/activities/Programming Class/signup"
+GYM_SIGNUP = "/activities/Gym Class/signup"
+GYM_UNREGISTER = "/activities/Gym Class/unregister"
 
 
 class TestRootEndpoint:
@@ -49,7 +17,7 @@ class TestRootEndpoint:
     
     def test_root_redirects_to_static(self, client):
         """Test that root redirects to static index.html"""
-        response = client.get("/", follow_redirects=False)
+        response = client.get("/")
         assert response.status_code == 307
         assert response.headers["location"] == "/static/index.html"
 
@@ -65,27 +33,48 @@ class TestGetActivities:
         assert "Chess Club" in data
         assert "Programming Class" in data
         assert "Gym Class" in data
+        assert data["Chess Club"]["participants"] == [
+            "daniel@mergington.edu", "michael@mergington.edu"
+        ]
+        assert data["Programming Class"]["participants"] == [
+            "emma@mergington.edu", "sophia@mergington.edu"
+        ]
+        assert data["Gym Class"]["participants"] == [
+            "john@mergington.edu", "olivia@mergington.edu"
+        ]
     
-    def test_activities_structure(self, client):
+    def test_signed_up_participant_listed_in_order(self, client):
+        """Test that a new signup appears in the sorted participants list"""
+        response = client.post(
+            CHESS_SIGNUP,
+            params={"email": "aaron@mergington.edu"}
+        )
+        assert response.status_code == 200
+        
+        data = client.get("/activities").json()
+        assert data["Chess Club"]["participants"] == [
+            "aaron@mergington.edu", "daniel@mergington.edu", "michael@mergington.edu"
+        ]
+    
+    @pytest.mark.parametrize("activity_name", ["Chess Club", "Programming Class", "Gym Class"])
+    def test_activities_structure(self, activities_snapshot, activity_name):
         """Test that activities have the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
+        activity_data = activities_snapshot[activity_name]
         
-        for activity_name, activity_data in data.items():
-            assert "description" in activity_data
-            assert "schedule" in activity_data
-            assert "max_participants" in activity_data
-            assert "participants" in activity_data
-            assert isinstance(activity_data["participants"], list)
+        assert "description" in activity_data
+        assert "schedule" in activity_data
+        assert "max_participants" in activity_data
+        assert "participants" in activity_data
+        assert isinstance(activity_data["participants"], list)
 
 
 class TestSignupForActivity:
     """Tests for the POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_for_existing_activity(self, client):
+    def test_signup_for_existing_activity(self, client, activities):
         """Test signing up for an existing activity"""
         response = client.post(
-            "/activities/Chess Club/signup",
+            CHESS_SIGNUP,
             params={"email": "test@mergington.edu"}
         )
         assert response.status_code == 200
@@ -93,47 +82,49 @@ class TestSignupForActivity:
         assert data["message"] == "Signed up test@mergington.edu for Chess Club"
         
         # Verify the participant was added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "test@mergington.edu" in activities_data["Chess Club"]["participants"]
+        assert "test@mergington.edu" in activities["Chess Club"]["participants"]
     
-    def test_signup_for_nonexistent_activity(self, client):
-        """Test signing up for a non-existent activity"""
-        response = client.post(
-            "/activities/Nonexistent Club/signup",
-            params={"email": "test@mergington.edu"}
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_multiple_signups(self, client):
+    def test_multiple_signups(self, client, activities):
         """Test multiple students signing up for the same activity"""
         emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
         
         for email in emails:
             response = client.post(
-                "/activities/Programming Class/signup",
+                PROG_SIGNUP,
                 params={"email": email}
             )
             assert response.status_code == 200
         
         # Verify all participants were added
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        participants = activities_data["Programming Class"]["participants"]
+        participants = activities["Programming Class"]["participants"]
         
         for email in emails:
             assert email in participants
+    
+    def test_activity_at_capacity_rejected(self, client, activities):
+        """Test that signing up for a full activity is rejected"""
+        # Fill the remaining spots directly rather than through the API
+        activities["Chess Club"]["participants"].update(
+            f"student{i}@mergington.edu" for i in range(10)
+        )
+        
+        response = client.post(
+            CHESS_SIGNUP,
+            params={"email": "overflow@mergington.edu"}
+        )
+        assert response.status_code == 400
+        data = response.json()
+        assert data["detail"] == "Activity is full"
+        assert "overflow@mergington.edu" not in activities["Chess Club"]["participants"]
 
 
 class TestUnregisterFromActivity:
     """Tests for the DELETE /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_existing_participant(self, client):
+    def test_unregister_existing_participant(self, client, activities):
         """Test unregistering an existing participant"""
         response = client.delete(
-            "/activities/Chess Club/unregister",
+            CHESS_UNREGISTER,
             params={"email": "michael@mergington.edu"}
         )
         assert response.status_code == 200
@@ -141,55 +132,57 @@ class TestUnregisterFromActivity:
         assert data["message"] == "Unregistered michael@mergington.edu from Chess Club"
         
         # Verify the participant was removed
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert "michael@mergington.edu" not in activities_data["Chess Club"]["participants"]
+        assert "michael@mergington.edu" not in activities["Chess Club"]["participants"]
     
-    def test_unregister_nonexistent_participant(self, client):
-        """Test unregistering a participant who is not signed up"""
-        response = client.delete(
-            "/activities/Chess Club/unregister",
-            params={"email": "nonexistent@mergington.edu"}
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Participant not found"
-    
-    def test_unregister_from_nonexistent_activity(self, client):
-        """Test unregistering from a non-existent activity"""
-        response = client.delete(
-            "/activities/Nonexistent Club/unregister",
-            params={"email": "test@mergington.edu"}
-        )
-        assert response.status_code == 404
-        data = response.json()
-        assert data["detail"] == "Activity not found"
-    
-    def test_signup_and_unregister_workflow(self, client):
+    def test_signup_and_unregister_workflow(self, client, activities):
         """Test the complete workflow of signing up and unregistering"""
         email = "workflow@mergington.edu"
         activity = "Gym Class"
         
         # Sign up
         signup_response = client.post(
-            f"/activities/{activity}/signup",
+            GYM_SIGNUP,
             params={"email": email}
         )
         assert signup_response.status_code == 200
         
         # Verify signup
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email in activities_data[activity]["participants"]
+        assert email in activities[activity]["participants"]
         
         # Unregister
         unregister_response = client.delete(
-            f"/activities/{activity}/unregister",
+            GYM_UNREGISTER,
             params={"email": email}
         )
         assert unregister_response.status_code == 200
         
         # Verify unregistration
-        activities_response = client.get("/activities")
-        activities_data = activities_response.json()
-        assert email not in activities_data[activity]["participants"]
+        assert email not in activities[activity]["participants"]
+
+
+class TestErrorResponses:
+    """Tests for 404 responses from the signup and unregister endpoints"""
+    
+    @pytest.mark.parametrize("method,url,params,expected_detail", [
+        ("post", "/activities/Nonexistent Club/signup",
+         {"email": "test@mergington.edu"}, "Activity not found"),
+        ("delete", "/activities/Nonexistent Club/unregister",
+         {"email": "test@mergington.edu"}, "Activity not found"),
+        ("delete", CHESS_UNREGISTER,
+         {"email": "nonexistent@mergington.edu"}, "Participant not found"),
+    ], ids=["signup-unknown-activity", "unregister-unknown-activity",
+            "unregister-unknown-participant"])
+    def test_not_found(self, client, method, url, params, expected_detail):
+        """Test that unknown activities and participants return 404"""
+        response = client.request(method, url, params=params)
+        assert response.status_code == 404
+        data = response.json()
+        assert data["detail"] == expected_detail
+
+
+class TestActivitiesDependency:
+    """Tests for the activity database dependency"""
+    
+    def test_get_activities_db_returns_module_data(self):
+        """Test that the dependency serves the module-level activities dict"""
+        assert app_module.get_activities_db() is app_module.activities